@@ -0,0 +1,288 @@
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import zipfile
+from pathlib import Path
+from typing import Dict, List
+
+DELTA_FORMAT = 1
+DELTA_MANIFEST = "delta.json"
+QUESTION_FILE_SUFFIX = "_questions.json"
+
+
+def sha256_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def sha256_file(path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def question_hash(question: Dict) -> str:
+    """Content hash of a single question, independent of key order."""
+    return sha256_bytes(json.dumps(question, sort_keys=True, separators=(",", ":")).encode("utf-8"))
+
+
+def dump_subject(document: Dict) -> bytes:
+    """Serialize a subject file exactly as QuestionProcessor.save_output does."""
+    return json.dumps(document, indent=2).encode("utf-8")
+
+
+def is_question_file(relative_path: str) -> bool:
+    return "/" not in relative_path and relative_path.endswith(QUESTION_FILE_SUFFIX)
+
+
+def scan_version(root) -> Dict[str, str]:
+    """Map every file under a corpus version to its content hash."""
+    root = Path(root)
+    return {
+        path.relative_to(root).as_posix(): sha256_file(path)
+        for path in sorted(root.rglob("*"))
+        if path.is_file()
+    }
+
+
+def version_hash(files: Dict[str, str]) -> str:
+    """Single hash identifying a whole corpus version."""
+    listing = "\n".join(f"{name}\t{digest}" for name, digest in sorted(files.items()))
+    return sha256_bytes(listing.encode("utf-8"))
+
+
+def _load_subject(root, name) -> Dict:
+    with open(os.path.join(root, name), 'r') as f:
+        return json.load(f)
+
+
+def _rebuild_topics(old_topics: Dict[str, List[Dict]], delta: Dict) -> Dict[str, List[Dict]]:
+    """Apply one subject's question delta to its old topics."""
+    removed = set(delta.get("removed", []))
+    changed = {entry["question"]["id"]: entry["question"] for entry in delta.get("changed", [])}
+    old_by_id = {
+        question["id"]: question
+        for questions in old_topics.values()
+        for question in questions
+    }
+    added_by_topic = {}
+    for entry in delta.get("added", []):
+        added_by_topic.setdefault(entry["topic"], []).append(entry)
+
+    topics = {}
+    for topic in delta["topic_order"]:
+        if topic in delta.get("order", {}):
+            # Explicit order: ids refer to old, changed or added questions
+            added = {entry["question"]["id"]: entry["question"] for entry in added_by_topic.get(topic, [])}
+            topics[topic] = [
+                added.get(qid) or changed.get(qid) or old_by_id[qid]
+                for qid in delta["order"][topic]
+            ]
+            continue
+
+        questions = [
+            changed.get(question["id"], question)
+            for question in old_topics.get(topic, [])
+            if question["id"] not in removed
+        ]
+        for entry in sorted(added_by_topic.get(topic, []), key=lambda entry: entry["index"]):
+            questions.insert(entry["index"], entry["question"])
+        topics[topic] = questions
+    return topics
+
+
+def diff_subject(old_doc: Dict, new_doc: Dict) -> Dict:
+    """Describe how one subject file changed at the question level."""
+    old_topics = old_doc.get("topics", {})
+    new_topics = new_doc.get("topics", {})
+    old_entries = {
+        question["id"]: (topic, question_hash(question))
+        for topic, questions in old_topics.items()
+        for question in questions
+    }
+    new_ids = set()
+
+    delta = {
+        "subject": new_doc.get("subject"),
+        "topic_order": list(new_topics.keys()),
+        "added": [],
+        "changed": [],
+        "removed": [],
+    }
+    for topic, questions in new_topics.items():
+        for index, question in enumerate(questions):
+            new_ids.add(question["id"])
+            previous = old_entries.get(question["id"])
+            if previous is None or previous[0] != topic:
+                delta["added"].append({"topic": topic, "index": index, "question": question})
+            elif previous[1] != question_hash(question):
+                delta["changed"].append({"question": question})
+
+    # Questions that moved topics are re-added under the new one
+    moved = {entry["question"]["id"] for entry in delta["added"] if entry["question"]["id"] in old_entries}
+    delta["removed"] = [qid for qid in old_entries if qid not in new_ids or qid in moved]
+
+    # Fall back to an explicit ID order only where the cheap rebuild differs
+    rebuilt = _rebuild_topics(old_topics, delta)
+    order = {
+        topic: [question["id"] for question in questions]
+        for topic, questions in new_topics.items()
+        if [q["id"] for q in rebuilt.get(topic, [])] != [q["id"] for q in questions]
+    }
+    if order:
+        delta["order"] = order
+    return delta
+
+
+def create_delta(old_root, new_root, package_path) -> Dict:
+    """Write a delta package that turns old_root into new_root."""
+    old_files = scan_version(old_root)
+    new_files = scan_version(new_root)
+
+    subjects = {}
+    blobs = {}
+    for name, digest in new_files.items():
+        if old_files.get(name) == digest:
+            continue
+        if is_question_file(name):
+            new_doc = _load_subject(new_root, name)
+            # The applier re-serializes with dump_subject, so only files in that
+            # exact form can be shipped as a question-level diff
+            if sha256_bytes(dump_subject(new_doc)) == digest:
+                old_doc = _load_subject(old_root, name) if name in old_files else {"topics": {}}
+                subjects[name] = diff_subject(old_doc, new_doc)
+                continue
+            print(f"⚠️ {name} is not in save_output form, shipping it whole")
+        blobs[name] = digest
+
+    # Content-addressed: a blob already present anywhere in the old version is not shipped
+    old_digests = set(old_files.values())
+    shipped = sorted({digest for digest in blobs.values() if digest not in old_digests})
+
+    manifest = {
+        "format": DELTA_FORMAT,
+        "base_version": version_hash(old_files),
+        "target_version": version_hash(new_files),
+        "subjects": subjects,
+        "blobs": blobs,
+        "removed_files": sorted(name for name in old_files if name not in new_files),
+        "target_files": new_files,
+    }
+
+    digest_to_name = {digest: name for name, digest in new_files.items()}
+    with zipfile.ZipFile(package_path, 'w', compression=zipfile.ZIP_DEFLATED) as package:
+        package.writestr(DELTA_MANIFEST, json.dumps(manifest, separators=(",", ":")))
+        for digest in shipped:
+            package.write(os.path.join(new_root, digest_to_name[digest]), f"blobs/{digest}")
+
+    changes = sum(len(s["added"]) + len(s["changed"]) + len(s["removed"]) for s in subjects.values())
+    print(f"Saved {package_path} ({os.path.getsize(package_path)} bytes): "
+          f"{changes} question changes, {len(shipped)} new blobs, "
+          f"{len(manifest['removed_files'])} removed files")
+    return manifest
+
+
+def _write_target(manifest, package, shipped, old_root, old_files, old_by_digest, staging):
+    """Write every file of the target version into the staging directory."""
+    for name, digest in manifest["target_files"].items():
+        target = os.path.join(staging, name)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        if name in manifest["subjects"]:
+            old_doc = _load_subject(old_root, name) if name in old_files else {"topics": {}}
+            delta = manifest["subjects"][name]
+            document = {
+                "subject": delta["subject"],
+                "topics": _rebuild_topics(old_doc.get("topics", {}), delta),
+            }
+            with open(target, 'wb') as f:
+                f.write(dump_subject(document))
+        elif digest in shipped:
+            with package.open(f"blobs/{digest}") as source, open(target, 'wb') as f:
+                shutil.copyfileobj(source, f)
+        elif digest in old_by_digest:
+            shutil.copyfile(os.path.join(old_root, old_by_digest[digest]), target)
+        else:
+            raise ValueError(f"Delta is missing content for {name}")
+
+
+def apply_delta(old_root, package_path, output_root) -> str:
+    """Reconstruct the new version from old_root and verify it by hash."""
+    old_files = scan_version(old_root)
+    with zipfile.ZipFile(package_path, 'r') as package:
+        manifest = json.loads(package.read(DELTA_MANIFEST))
+        if manifest.get("format") != DELTA_FORMAT:
+            raise ValueError(f"Unsupported delta format: {manifest.get('format')}")
+        if version_hash(old_files) != manifest["base_version"]:
+            raise ValueError(f"{old_root} is not the base version of {package_path}")
+
+        old_by_digest = {digest: name for name, digest in old_files.items()}
+        shipped = {Path(name).name for name in package.namelist() if name.startswith("blobs/")}
+
+        # Stage next to the output so the final swap is a same-filesystem rename;
+        # normalizing first keeps a trailing slash from nesting it inside
+        output_root = os.path.normpath(os.path.abspath(output_root))
+        parent = os.path.dirname(output_root)
+        os.makedirs(parent, exist_ok=True)
+        staging = tempfile.mkdtemp(prefix=f"{os.path.basename(output_root)}.partial-", dir=parent)
+        os.chmod(staging, 0o755)  # mkdtemp is owner-only
+        try:
+            _write_target(manifest, package, shipped, old_root, old_files, old_by_digest, staging)
+        except Exception:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+    new_files = scan_version(staging)
+    if new_files != manifest["target_files"] or version_hash(new_files) != manifest["target_version"]:
+        mismatched = sorted(
+            name for name in set(new_files) | set(manifest["target_files"])
+            if new_files.get(name) != manifest["target_files"].get(name)
+        )
+        shutil.rmtree(staging)
+        raise ValueError(f"Reconstructed version failed verification: {mismatched[:5]}")
+
+    # Move the old tree aside and only delete it once the new one is in place,
+    # so an in-place update never leaves nothing behind
+    backup = None
+    if os.path.exists(output_root):
+        backup = f"{staging}.old"
+        os.replace(output_root, backup)
+    try:
+        os.replace(staging, output_root)
+    except OSError:
+        if backup is not None:
+            os.replace(backup, output_root)
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    if backup is not None:
+        shutil.rmtree(backup)
+    print(f"✅ Rebuilt {output_root} ({len(new_files)} files, version {manifest['target_version'][:12]})")
+    return manifest["target_version"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Create or apply corpus delta packages.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    create = subparsers.add_parser("create", help="Diff two corpus versions")
+    create.add_argument("old_root")
+    create.add_argument("new_root")
+    create.add_argument("package")
+
+    apply = subparsers.add_parser("apply", help="Rebuild a new version from an old one")
+    apply.add_argument("old_root")
+    apply.add_argument("package")
+    apply.add_argument("output_root")
+
+    args = parser.parse_args()
+    if args.command == "create":
+        create_delta(args.old_root, args.new_root, args.package)
+    else:
+        apply_delta(args.old_root, args.package, args.output_root)
+
+
+if __name__ == "__main__":
+    main()
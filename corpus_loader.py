@@ -0,0 +1,230 @@
+import json
+import os
+import re
+import struct
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from question_model import Question
+
+# Subject files are written by QuestionProcessor.save_output with indent=2,
+# so topics and questions sit at fixed indentation and can be located
+# without decoding the whole document.
+TOPIC_PATTERN = re.compile(rb'\n    ("(?:[^"\\]|\\.)*"): \[')
+QUESTION_PATTERN = re.compile(rb'\n      \{\n        "id": ("(?:[^"\\]|\\.)*"|null)')
+QUESTION_END = b'\n      }'
+
+
+def image_size(path) -> Optional[Tuple[int, int]]:
+    """Read (width, height) from a PNG, GIF or JPEG header without decoding pixels."""
+    with open(path, 'rb') as f:
+        head = f.read(26)
+        if head[:8] == b'\x89PNG\r\n\x1a\n' and head[12:16] == b'IHDR' and len(head) >= 24:
+            return struct.unpack('>II', head[16:24])
+        if head[:6] in (b'GIF87a', b'GIF89a'):
+            return struct.unpack('<HH', head[6:10])
+        if head[:2] != b'\xff\xd8':
+            return None
+
+        # JPEG: walk the segment markers up to the first start-of-frame
+        f.seek(2)
+        while True:
+            marker = f.read(2)
+            if len(marker) < 2 or marker[0] != 0xFF:
+                return None
+            code = marker[1]
+            if code in (0xD8, 0x01) or 0xD0 <= code <= 0xD7:
+                continue
+            length_bytes = f.read(2)
+            if len(length_bytes) < 2:
+                return None
+            length = struct.unpack('>H', length_bytes)[0]
+            if 0xC0 <= code <= 0xCF and code not in (0xC4, 0xC8, 0xCC):
+                height, width = struct.unpack('>xHH', f.read(5))
+                return width, height
+            f.seek(length - 2, os.SEEK_CUR)
+
+
+class _SubjectIndex:
+    """Byte ranges of every question in one subject file."""
+
+    def __init__(self, path):
+        stat = os.stat(path)
+        self.path = path
+        self.signature = (stat.st_mtime_ns, stat.st_size)
+        self.topics: Dict[str, List[Tuple[str, int, int]]] = {}
+        # Only used when the file is not in save_output's layout
+        self.decoded: Optional[Dict[str, List[Question]]] = None
+
+        with open(path, 'rb') as f:
+            data = f.read()
+
+        if not data.isascii() or not self._index_offsets(data):
+            self._decode(data)
+
+    def _index_offsets(self, data) -> bool:
+        """Locate questions by byte range; False if the layout doesn't allow it."""
+        topic_matches = list(TOPIC_PATTERN.finditer(data))
+        if not topic_matches:
+            return False
+        question_matches = list(QUESTION_PATTERN.finditer(data))
+
+        topics = {}
+        boundaries = [match.start() for match in topic_matches[1:]] + [len(data)]
+        position = 0
+        for topic_match, boundary in zip(topic_matches, boundaries):
+            entries = topics[json.loads(topic_match.group(1))] = []
+            while position < len(question_matches) and question_matches[position].start() < boundary:
+                match = question_matches[position]
+                start = match.start() + 1
+                end = data.index(QUESTION_END, start) + len(QUESTION_END)
+                entries.append((json.loads(match.group(1)), start, end))
+                position += 1
+
+            # Every question object in the block must have been matched,
+            # otherwise e.g. "id" wasn't the first key and we'd miss some
+            if data.count(b'\n      {', topic_match.end(), boundary) != len(entries):
+                return False
+
+        self.topics = topics
+        return True
+
+    def _decode(self, data):
+        document = json.loads(data)
+        self.decoded = {
+            topic: [Question.from_dict(q) for q in questions]
+            for topic, questions in document.get("topics", {}).items()
+        }
+        self.topics = {
+            topic: [(q.id, -1, -1) for q in questions]
+            for topic, questions in self.decoded.items()
+        }
+
+    def is_stale(self) -> bool:
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return True
+        return (stat.st_mtime_ns, stat.st_size) != self.signature
+
+
+class CorpusLoader:
+    """Lazy, LRU-cached access to the processed corpus.
+
+    Subject files are only indexed when first touched, individual questions
+    are decoded on demand, and any file that changes on disk is re-indexed
+    on the next access.
+    """
+
+    def __init__(self, output_dir="data/processed_questions",
+                 images_dir="data/questions/images", max_questions=256):
+        self.output_dir = output_dir
+        self.images_dir = images_dir
+        self.max_questions = max_questions
+        self._manifest = None
+        self._manifest_signature = None
+        self._subjects: Dict[str, _SubjectIndex] = {}
+        self._questions: "OrderedDict[Tuple[str, str, int], Question]" = OrderedDict()
+        self._image_sizes: Dict[str, Tuple[Tuple[int, int], Optional[Tuple[int, int]]]] = {}
+
+    def _manifest_path(self):
+        return os.path.join(self.output_dir, "questions_manifest.json")
+
+    def manifest(self) -> Dict:
+        path = self._manifest_path()
+        stat = os.stat(path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if self._manifest is None or signature != self._manifest_signature:
+            with open(path, 'r') as f:
+                self._manifest = json.load(f)
+            self._manifest_signature = signature
+        return self._manifest
+
+    def subjects(self) -> List[str]:
+        return list(self.manifest().get("subjects", []))
+
+    def _subject_index(self, subject) -> _SubjectIndex:
+        index = self._subjects.get(subject)
+        if index is not None and not index.is_stale():
+            return index
+
+        # Drop cached questions from the old version of this file
+        for key in [key for key in self._questions if key[0] == subject]:
+            del self._questions[key]
+
+        path = os.path.join(self.output_dir, f"{subject.lower()}_questions.json")
+        index = self._subjects[subject] = _SubjectIndex(path)
+        return index
+
+    def topics(self, subject) -> List[str]:
+        return list(self._subject_index(subject).topics)
+
+    def question_count(self, subject, topic=None) -> int:
+        index = self._subject_index(subject)
+        if topic is not None:
+            return len(index.topics.get(topic, []))
+        return sum(len(entries) for entries in index.topics.values())
+
+    def question_ids(self, subject, topic) -> List[str]:
+        return [question_id for question_id, _, _ in self._subject_index(subject).topics.get(topic, [])]
+
+    def get(self, subject, topic, position) -> Question:
+        """Return one question by its position within a topic."""
+        index = self._subject_index(subject)
+        key = (subject, topic, position)
+        question = self._questions.get(key)
+        if question is not None:
+            self._questions.move_to_end(key)
+            return question
+
+        if index.decoded is not None:
+            question = index.decoded[topic][position]
+        else:
+            _, start, end = index.topics[topic][position]
+            with open(index.path, 'rb') as f:
+                f.seek(start)
+                question = Question.from_dict(json.loads(f.read(end - start)))
+
+        self._questions[key] = question
+        if len(self._questions) > self.max_questions:
+            self._questions.popitem(last=False)
+        return question
+
+    def iter_questions(self, subject, topic) -> Iterator[Question]:
+        for position in range(self.question_count(subject, topic)):
+            yield self.get(subject, topic, position)
+
+    def find(self, question_id) -> Optional[Question]:
+        """Look a question up by ID across all subjects."""
+        for subject in self.subjects():
+            try:
+                index = self._subject_index(subject)
+            except FileNotFoundError:
+                continue  # listed in the manifest but not on disk, as in load_output
+            for topic, entries in index.topics.items():
+                for position, (entry_id, _, _) in enumerate(entries):
+                    if entry_id == question_id:
+                        return self.get(subject, topic, position)
+        return None
+
+    def image_path(self, image) -> str:
+        return os.path.join(self.images_dir, image)
+
+    def image_size(self, image) -> Optional[Tuple[int, int]]:
+        """Cached header-only image dimensions, or None if missing or unknown."""
+        path = self.image_path(image)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._image_sizes.get(path)
+        if cached is None or cached[0] != signature:
+            cached = self._image_sizes[path] = (signature, image_size(path))
+        return cached[1]
+
+    def clear(self):
+        self._subjects.clear()
+        self._questions.clear()
+        self._image_sizes.clear()
+        self._manifest = None
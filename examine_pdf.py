@@ -1,7 +1,9 @@
+import sys
 from PyPDF2 import PdfReader
 
-def examine_pdf():
-    pdf_path = '/Users/christiancattaneo/Downloads/SAT Question Bank PDFs/Updated Files/Math/Algebra/Linear Equations in One Variable/Linear Equations in One Variable 1.pdf'
+DEFAULT_PDF_PATH = '/Users/christiancattaneo/Downloads/SAT Question Bank PDFs/Updated Files/Math/Algebra/Linear Equations in One Variable/Linear Equations in One Variable 1.pdf'
+
+def examine_pdf(pdf_path=DEFAULT_PDF_PATH):
     reader = PdfReader(pdf_path)
     
     # Print first page content
@@ -13,4 +15,4 @@ def examine_pdf():
     print(f"\nTotal pages: {len(reader.pages)}")
 
 if __name__ == "__main__":
-    examine_pdf() 
\ No newline at end of file
+    examine_pdf(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_PDF_PATH) 
\ No newline at end of file
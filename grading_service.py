@@ -0,0 +1,254 @@
+import argparse
+import json
+import os
+import random
+import string
+import time
+from fractions import Fraction
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+from process_questions import QuestionProcessor
+from question_model import AnswerOption
+
+INDEX_FILENAME = "answer_key_index.json"
+RATIONALES_FILENAME = "answer_key_rationales.txt"
+
+
+def normalize_spr(value) -> str:
+    """Canonical form of a student-produced response, so 3/4, .75 and 0.75 match."""
+    text = str(value).strip().replace(" ", "")
+    try:
+        return str(Fraction(text))
+    except (ValueError, ZeroDivisionError):
+        return text.lower()
+
+
+def build_answer_key(data, output_dir) -> Dict:
+    """Write the answer-key index and rationale sidecar for a processed corpus."""
+    keys = {}
+    rationales_path = os.path.join(output_dir, RATIONALES_FILENAME)
+    offset = 0
+    with open(rationales_path, 'wb') as rationales:
+        for subject, topics in data.items():
+            for topic, questions in topics.items():
+                for question in questions:
+                    entry = {
+                        "type": question.type,
+                        "subject": subject,
+                        "topic": topic,
+                        "skill": question.skill,
+                        "difficulty": question.difficulty,
+                    }
+                    if question.options:
+                        letters = string.ascii_uppercase
+                        valid = set(letters[:len(question.options)])
+                        correct = [a for a in question.correct_answers if a in valid]
+                        invalid = [a for a in question.correct_answers if a not in valid]
+                        if invalid:
+                            note = "" if correct else ", no response will be graded correct"
+                            print(f"⚠️ {question.id}: ignoring correct answers that are not "
+                                  f"option letters {invalid}{note}")
+                        entry["correct_letters"] = correct
+                        entry["correct_option_ids"] = [
+                            question.options[letters.index(letter)].id
+                            for letter in correct
+                            if isinstance(question.options[letters.index(letter)], AnswerOption)
+                        ]
+                    else:
+                        entry["accepted_values"] = sorted({normalize_spr(a) for a in question.correct_answers})
+
+                    encoded = (question.explanation or "").encode("utf-8")
+                    rationales.write(encoded)
+                    entry["rationale"] = [offset, len(encoded)]
+                    offset += len(encoded)
+                    keys[question.id] = entry
+
+    index = {"rationales": RATIONALES_FILENAME, "questions": keys}
+    index_path = os.path.join(output_dir, INDEX_FILENAME)
+    with open(index_path, 'w') as f:
+        json.dump(index, f, separators=(",", ":"))
+    print(f"Saved answer keys for {len(keys)} questions to {index_path}")
+    return index
+
+
+class AnswerKeyIndex:
+    def __init__(self, index_dir):
+        with open(os.path.join(index_dir, INDEX_FILENAME), 'r') as f:
+            index = json.load(f)
+        self.rationales_path = os.path.join(index_dir, index["rationales"])
+
+        # Precompute lookup sets once so grading is a dict hit plus a set test
+        self.keys = {}
+        for question_id, entry in index["questions"].items():
+            if "accepted_values" in entry:
+                accepted = frozenset(entry["accepted_values"])
+                is_spr = True
+            else:
+                accepted = frozenset(entry["correct_letters"]) | frozenset(entry["correct_option_ids"])
+                is_spr = False
+            self.keys[question_id] = (
+                accepted, is_spr, entry["skill"], entry["difficulty"], entry["rationale"]
+            )
+
+    def __len__(self):
+        return len(self.keys)
+
+    def rationale(self, question_id) -> Optional[str]:
+        """Read one rationale from the sidecar file by offset."""
+        key = self.keys.get(question_id)
+        if key is None:
+            return None
+        offset, length = key[4]
+        with open(self.rationales_path, 'rb') as f:
+            f.seek(offset)
+            return f.read(length).decode("utf-8")
+
+    def grade_batch(self, responses: List[Dict]) -> Dict:
+        """Grade a batch of {"question_id", "response"} items with aggregates."""
+        results = []
+        by_skill = {}
+        by_difficulty = {}
+        unknown = 0
+        correct_total = 0
+        keys = self.keys
+
+        for item in responses:
+            question_id = item.get("question_id")
+            key = keys.get(question_id) if isinstance(question_id, str) else None
+            if key is None:
+                unknown += 1
+                results.append({"question_id": question_id, "correct": None})
+                continue
+
+            accepted, is_spr, skill, difficulty, _ = key
+            response = item.get("response")
+            if is_spr:
+                correct = normalize_spr(response) in accepted
+            else:
+                # Accept either the option letter or the option ID
+                response = str(response).strip()
+                correct = response.upper() in accepted or response in accepted
+            correct_total += correct
+            results.append({"question_id": question_id, "correct": correct})
+
+            for groups, name in ((by_skill, skill), (by_difficulty, difficulty)):
+                stats = groups.get(name)
+                if stats is None:
+                    stats = groups[name] = [0, 0]
+                stats[0] += 1
+                stats[1] += correct
+
+        def summarize(groups):
+            return {
+                name: {"answered": answered, "correct": correct, "accuracy": correct / answered}
+                for name, (answered, correct) in groups.items()
+            }
+
+        graded = len(responses) - unknown
+        return {
+            "results": results,
+            "summary": {
+                "graded": graded,
+                "correct": correct_total,
+                "unknown": unknown,
+                "accuracy": correct_total / graded if graded else 0.0,
+            },
+            "by_skill": summarize(by_skill),
+            "by_difficulty": summarize(by_difficulty),
+        }
+
+
+class GradingRequestHandler(BaseHTTPRequestHandler):
+    index: AnswerKeyIndex = None
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        if self.path != "/grade":
+            self._send_json(404, {"error": "not found"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            if length < 0:
+                raise ValueError("negative Content-Length")
+            payload = json.loads(self.rfile.read(length))
+            responses = payload["responses"]
+        except (ValueError, KeyError, TypeError) as e:
+            self._send_json(400, {"error": f"invalid request: {e}"})
+            return
+        if not isinstance(responses, list) or not all(isinstance(item, dict) for item in responses):
+            self._send_json(400, {"error": "invalid request: responses must be a list of objects"})
+            return
+        self._send_json(200, self.index.grade_batch(responses))
+
+    def do_GET(self):
+        if self.path.startswith("/rationale/"):
+            rationale = self.index.rationale(self.path[len("/rationale/"):])
+            if rationale is None:
+                self._send_json(404, {"error": "unknown question"})
+            else:
+                self._send_json(200, {"rationale": rationale})
+        elif self.path == "/health":
+            self._send_json(200, {"questions": len(self.index)})
+        else:
+            self._send_json(404, {"error": "not found"})
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(index: AnswerKeyIndex, host="127.0.0.1", port=8765):
+    GradingRequestHandler.index = index
+    server = ThreadingHTTPServer((host, port), GradingRequestHandler)
+    print(f"Grading {len(index)} questions on http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def benchmark(index: AnswerKeyIndex, responses=100000, seed=0) -> float:
+    """Grade random responses and report responses per second."""
+    rng = random.Random(seed)
+    question_ids = list(index.keys)
+    batch = [
+        {"question_id": rng.choice(question_ids), "response": rng.choice("ABCD")}
+        for _ in range(responses)
+    ]
+    start = time.perf_counter()
+    result = index.grade_batch(batch)
+    elapsed = time.perf_counter() - start
+    rate = responses / elapsed if elapsed else float("inf")
+    print(f"Graded {result['summary']['graded']} responses in {elapsed:.3f}s ({rate:,.0f} responses/s)")
+    return rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch answer grading over a precomputed answer-key index.")
+    parser.add_argument("command", choices=["build", "serve", "benchmark"])
+    parser.add_argument("--output-dir", default="data/processed_questions")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--responses", type=int, default=100000)
+    args = parser.parse_args()
+
+    if args.command == "build":
+        processor = QuestionProcessor(None, "data/questions/images", args.output_dir)
+        build_answer_key(processor.load_output(), args.output_dir)
+    elif args.command == "serve":
+        serve(AnswerKeyIndex(args.output_dir), args.host, args.port)
+    else:
+        benchmark(AnswerKeyIndex(args.output_dir), args.responses)
+
+
+if __name__ == "__main__":
+    main()
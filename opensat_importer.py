@@ -0,0 +1,364 @@
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from process_questions import QuestionProcessor
+from question_model import Question
+
+# Field path -> accepted types for a single OpenSAT record
+OPENSAT_SCHEMA = {
+    ("id",): (str,),
+    ("domain",): (str,),
+    ("question",): (dict,),
+    ("question", "question"): (str,),
+    ("question", "choices"): (dict,),
+    ("question", "correct_answer"): (str,),
+}
+
+DIFFICULTY_CODES = {"e": "E", "m": "M", "h": "H"}
+
+READ_CHUNK_SIZE = 1 << 16
+
+
+def compile_schema(schema: Dict[Tuple[str, ...], Tuple[type, ...]]) -> Callable[[Dict], List[str]]:
+    """Compile a path -> types mapping into a single validation function."""
+    checks = [
+        (path, types, ".".join(path), " or ".join(t.__name__ for t in types))
+        for path, types in sorted(schema.items(), key=lambda item: len(item[0]))
+    ]
+
+    def validate(record: Dict) -> List[str]:
+        errors = []
+        for path, types, label, type_names in checks:
+            value = record
+            for key in path:
+                if not isinstance(value, dict) or key not in value:
+                    value = None
+                    break
+                value = value[key]
+            if not isinstance(value, types):
+                errors.append(f"{label} must be {type_names}")
+        if not errors:
+            question = record["question"]
+            if question["correct_answer"] not in question["choices"]:
+                errors.append("question.correct_answer must name one of question.choices")
+        return errors
+
+    return validate
+
+
+validate_opensat_record = compile_schema(OPENSAT_SCHEMA)
+
+
+def convert_opensat_record(record: Dict, subject: str) -> Question:
+    """Convert a validated OpenSAT record into a corpus question."""
+    question = record["question"]
+    choices = question["choices"]
+    question_id = record["id"]
+
+    paragraph = question.get("paragraph")
+    text = f"<p>{question['question']}</p>"
+    if paragraph and paragraph != "null":
+        text = f"<p>{paragraph}</p>{text}"
+
+    difficulty = record.get("difficulty") or ""
+    return Question(
+        id=question_id,
+        type="mcq",
+        subject=subject,
+        topic=record["domain"],
+        skill=record.get("skill") or record["domain"],
+        difficulty=DIFFICULTY_CODES.get(difficulty[:1].lower(), "M"),
+        text=text,
+        options=[
+            {"id": f"{question_id}-{letter}", "content": f"<p>{content}</p>"}
+            for letter, content in choices.items()
+        ],
+        correct_answers=[question["correct_answer"]],
+        explanation=question.get("explanation") or "",
+    )
+
+
+def _convert_batch(batch: List[Tuple[str, Dict]]) -> Tuple[List[Question], List[Tuple[Optional[str], List[str]]]]:
+    """Validate and convert a batch of (subject, record) pairs."""
+    converted = []
+    rejected = []
+    for subject, record in batch:
+        errors = validate_opensat_record(record) if isinstance(record, dict) else ["record must be an object"]
+        if errors:
+            record_id = record.get("id") if isinstance(record, dict) else None
+            rejected.append((record_id, errors))
+            continue
+        converted.append(convert_opensat_record(record, subject))
+    return converted, rejected
+
+
+def _convert_lines(batch: List[Tuple[str, str]]) -> Tuple[List[Tuple], List[Tuple[Optional[str], List[str]]]]:
+    """Worker entry point: decode, validate and convert raw JSON Lines.
+
+    Decoding happens here rather than in the parent, and results go back as
+    plain tuples of constructor arguments; the parent builds the Question
+    objects so categorical strings are interned once in its own process.
+    """
+    rows = []
+    rejected = []
+    for default_subject, line in batch:
+        record = json.loads(line)
+        subject = record.get("subject", default_subject) if isinstance(record, dict) else default_subject
+        converted, record_rejected = _convert_batch([(str(subject).capitalize(), record)])
+        rejected.extend(record_rejected)
+        for question in converted:
+            rows.append((
+                question.id, question.type, question.subject, question.topic, question.skill,
+                question.difficulty, question.text,
+                [option.to_dict() for option in question.options],
+                question.correct_answers, question.explanation, question.images,
+            ))
+    return rows, rejected
+
+
+class _JSONStream:
+    """Incrementally decode JSON values from a file without reading it whole."""
+
+    def __init__(self, f):
+        self.f = f
+        self.buffer = ""
+        self.pos = 0
+        self.decoder = json.JSONDecoder()
+        self.eof = False
+
+    def _fill(self):
+        chunk = self.f.read(READ_CHUNK_SIZE)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character, or '' at end of file."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos].isspace():
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str):
+        if self.peek() != char:
+            raise ValueError(f"Expected {char!r} in OpenSAT dump, found {self.peek()!r}")
+        self.pos += 1
+
+    def value(self):
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number may be cut off at the chunk boundary
+            if end == len(self.buffer) and not self.eof and self._fill():
+                continue
+            self.pos = end
+            return value
+
+    def array_items(self) -> Iterator:
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.peek() == ",":
+                self.pos += 1
+                continue
+            self.expect("]")
+            return
+
+
+def stream_opensat_records(path: str, default_subject: str = "English") -> Iterator[Tuple[str, Dict]]:
+    """Yield (subject, record) pairs from an OpenSAT dump.
+
+    Supports the upstream layout (``{"english": [...], "math": [...]}``),
+    a bare JSON array and JSON Lines.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        stream = _JSONStream(f)
+        first = stream.peek()
+        if first == "[":
+            for record in stream.array_items():
+                yield default_subject, record
+        elif first == "{":
+            # Either a sectioned dump or the first line of a JSON Lines file
+            stream.pos += 1
+            if stream.peek() == "}":
+                return
+            key = stream.value()
+            stream.expect(":")
+            if stream.peek() == "[":
+                while True:
+                    subject = str(key).capitalize()
+                    for record in stream.array_items():
+                        yield subject, record
+                    if stream.peek() != ",":
+                        stream.expect("}")
+                        break
+                    stream.pos += 1
+                    key = stream.value()
+                    stream.expect(":")
+            else:
+                f.seek(0)
+                yield from _stream_json_lines(f, default_subject)
+        elif first:
+            raise ValueError(f"Unrecognized OpenSAT dump format in {path}")
+
+
+def detect_dump_format(path: str) -> str:
+    """Return "array", "sections" or "jsonl" using the same rules as the streamer."""
+    with open(path, "r", encoding="utf-8") as f:
+        stream = _JSONStream(f)
+        first = stream.peek()
+        if first == "[":
+            return "array"
+        if first != "{":
+            return "jsonl"
+        stream.pos += 1
+        if stream.peek() == "}":
+            return "sections"
+        stream.value()
+        stream.expect(":")
+        return "sections" if stream.peek() == "[" else "jsonl"
+
+
+def _stream_raw_lines(path: str, default_subject: str) -> Iterator[Tuple[str, str]]:
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield default_subject, line
+
+
+def _stream_json_lines(f, default_subject: str) -> Iterator[Tuple[str, Dict]]:
+    for line in f:
+        line = line.strip()
+        if line:
+            record = json.loads(line)
+            subject = record.get("subject", default_subject) if isinstance(record, dict) else default_subject
+            yield str(subject).capitalize(), record
+
+
+def _batches(iterable, size: int) -> Iterator[List]:
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+class OpenSATImporter:
+    def __init__(self, output_dir, images_dir="data/questions/images",
+                 workers: int = 1, batch_size: int = 500):
+        self.output_dir = output_dir
+        self.images_dir = images_dir
+        # Serial by default: conversion is cheap next to decoding, so workers
+        # only pay off when they also do the decoding (JSON Lines input)
+        self.workers = max(1, workers or 1)
+        self.batch_size = batch_size
+        # Keep at most a couple of batches per worker in flight
+        self.max_pending = self.workers * 2
+
+    def convert_stream(self, dump_path: str, default_subject: str = "English") -> Iterator[Tuple[List[Question], List]]:
+        """Validate and convert a dump, in parallel for JSON Lines, with bounded memory."""
+        if self.workers > 1 and detect_dump_format(dump_path) == "jsonl":
+            yield from self._convert_lines_parallel(dump_path, default_subject)
+            return
+        if self.workers > 1:
+            print("⚠️ Only JSON Lines dumps are converted in parallel, using one worker")
+
+        for batch in _batches(stream_opensat_records(dump_path, default_subject), self.batch_size):
+            yield _convert_batch(batch)
+
+    def _convert_lines_parallel(self, dump_path: str, default_subject: str) -> Iterator[Tuple[List[Question], List]]:
+        def build(result):
+            rows, rejected = result
+            # Question() interns the categoricals again in this process
+            return [Question(*row) for row in rows], rejected
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            pending = []
+            for batch in _batches(_stream_raw_lines(dump_path, default_subject), self.batch_size):
+                pending.append(executor.submit(_convert_lines, batch))
+                if len(pending) >= self.max_pending:
+                    yield build(pending.pop(0).result())
+            for future in pending:
+                yield build(future.result())
+
+    def import_dump(self, dump_path: str, default_subject: str = "English") -> Dict:
+        """Stream a dump into the processed corpus and save the result."""
+        start = time.perf_counter()
+        processor = QuestionProcessor(dump_path, self.images_dir, self.output_dir)
+        # Refuse to merge into a partial corpus: saving would drop missing subjects
+        corpus = processor.load_output(strict=True)
+        seen_ids = {
+            question.id
+            for topics in corpus.values()
+            for questions in topics.values()
+            for question in questions
+        }
+
+        stats = {"read": 0, "imported": 0, "duplicates": 0, "rejected": 0}
+        for converted, rejected in self.convert_stream(dump_path, default_subject):
+            stats["read"] += len(converted) + len(rejected)
+            stats["rejected"] += len(rejected)
+            for record_id, errors in rejected:
+                print(f"❌ Rejected {record_id}: {'; '.join(errors)}")
+            for question in converted:
+                if question.id in seen_ids:
+                    stats["duplicates"] += 1
+                    continue
+                seen_ids.add(question.id)
+                topics = corpus.setdefault(question.subject, {})
+                topics.setdefault(question.topic, []).append(question)
+                stats["imported"] += 1
+
+        processor.save_output(corpus)
+
+        elapsed = time.perf_counter() - start
+        stats["seconds"] = elapsed
+        stats["records_per_second"] = stats["read"] / elapsed if elapsed else 0.0
+        print(f"✅ Imported {stats['imported']} questions "
+              f"({stats['duplicates']} duplicates, {stats['rejected']} rejected) "
+              f"from {stats['read']} records in {elapsed:.2f}s "
+              f"({stats['records_per_second']:.0f} records/s)")
+        return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import an OpenSAT dump into the processed corpus.")
+    parser.add_argument("dump", help="OpenSAT JSON, JSON array or JSON Lines file")
+    parser.add_argument("--output-dir", default="data/processed_questions")
+    parser.add_argument("--subject", default="English", help="Subject for records without a section")
+    parser.add_argument("--workers", type=int, default=1, help="Parallel workers (JSON Lines only)")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    importer = OpenSATImporter(args.output_dir, workers=args.workers, batch_size=args.batch_size)
+    try:
+        importer.import_dump(args.dump, default_subject=args.subject)
+    except FileNotFoundError as e:
+        print(f"❌ {e}")
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,10 @@
 import os
 import json
+import time
 import fitz  # PyMuPDF
 import re
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
 class SATQuestionParser:
@@ -126,45 +129,55 @@ class SATQuestionParser:
             print(f"Error parsing question: {str(e)}")
             return None
     
-    def process_pdf(self):
-        """Process the PDF and extract all questions."""
-        output_data = {
-            "questions": []
-        }
+    def process_page(self, page, page_num):
+        """Extract the question on a single page, if there is one."""
+        print(f"\nProcessing page {page_num + 1}...")
+        
+        # Get text
+        text = page.get_text()
+        
+        # Get question ID for images
+        id_match = re.search(r'ID:\s*(\w+)', text)
+        if not id_match:
+            return None
+        question_id = id_match.group(1)
+        
+        # Extract images
+        images = self.extract_images_from_page(page, question_id)
+        
+        # Parse question and answer
+        question = self.parse_question_and_answer(text, images)
+        if question:
+            print(f"Successfully parsed question {question['id']} with {len(question['images'])} images")
+        else:
+            print(f"Failed to parse question from page {page_num + 1}")
+        return question
+    
+    def process_pages(self, start=0, end=None):
+        """Process a range of pages and return the parsed questions."""
+        questions = []
         
         try:
             doc = fitz.open(self.pdf_path)
+            end = len(doc) if end is None else min(end, len(doc))
             
-            # Process each page
-            for page_num, page in enumerate(doc):
-                print(f"\nProcessing page {page_num + 1}...")
-                
-                # Get text
-                text = page.get_text()
-                
-                # Get question ID for images
-                id_match = re.search(r'ID:\s*(\w+)', text)
-                if not id_match:
-                    continue
-                question_id = id_match.group(1)
-                
-                # Extract images
-                images = self.extract_images_from_page(page, question_id)
-                
-                # Parse question and answer
-                question = self.parse_question_and_answer(text, images)
+            for page_num in range(start, end):
+                question = self.process_page(doc[page_num], page_num)
                 if question:
-                    output_data["questions"].append(question)
-                    print(f"Successfully parsed question {question['id']} with {len(question['images'])} images")
-                else:
-                    print(f"Failed to parse question from page {page_num + 1}")
+                    questions.append(question)
                     
             doc.close()
             
         except Exception as e:
             print(f"Error processing PDF: {str(e)}")
             
-        return output_data
+        return questions
+    
+    def process_pdf(self):
+        """Process the PDF and extract all questions."""
+        return {
+            "questions": self.process_pages()
+        }
     
     def save_json(self, data, filename="sat_questions.json"):
         """Save parsed data to JSON file."""
@@ -173,13 +186,129 @@ class SATQuestionParser:
             json.dump(data, f, indent=2)
         print(f"\nSaved {len(data['questions'])} questions to {output_path}")
 
-def main():
-    pdf_path = "SAT Suite Question Bank - Results.pdf"
-    output_dir = "data/questions"
+def describe_pdf_path(pdf_path, root_dir):
+    """Derive subject, domain and skill from a question bank path.
+    
+    Uses the last three folders, so ``.../<Subject>/<Domain>/<Skill>/<Skill> N.pdf``
+    works whether the root is the bank itself or any directory above it.
+    """
+    folders = Path(pdf_path).relative_to(root_dir).parts[:-1]
+    if len(folders) < 3:
+        raise ValueError(
+            f"{pdf_path} is not under <Subject>/<Domain>/<Skill>/ relative to {root_dir}"
+        )
     
+    return {
+        "subject": folders[-3],
+        "domain": folders[-2],
+        "skill": folders[-1]
+    }
+
+def _process_work_unit(pdf_path, output_dir, start, end):
+    """Worker entry point: parse one page range of one PDF."""
     parser = SATQuestionParser(pdf_path, output_dir)
+    return parser.process_pages(start, end)
+
+class BatchIngestor:
+    def __init__(self, root_dir, output_dir, workers=None, pages_per_unit=8):
+        self.root_dir = root_dir
+        self.output_dir = output_dir
+        self.workers = workers or os.cpu_count() or 1
+        self.pages_per_unit = pages_per_unit
+        
+    def find_pdfs(self):
+        """Walk the root directory for PDFs in a stable order."""
+        return sorted(
+            path for path in Path(self.root_dir).rglob("*")
+            if path.is_file() and path.suffix.lower() == ".pdf"
+        )
+        
+    def plan_work_units(self, pdf_paths):
+        """Split every PDF into (file, start, end) page ranges."""
+        # Check every path up front so a wrong root fails before any parsing
+        for pdf_path in pdf_paths:
+            describe_pdf_path(pdf_path, self.root_dir)
+            
+        units = []
+        for pdf_path in pdf_paths:
+            try:
+                with fitz.open(str(pdf_path)) as doc:
+                    page_count = len(doc)
+            except Exception as e:
+                print(f"Error opening {pdf_path}: {str(e)}")
+                continue
+                
+            for start in range(0, page_count, self.pages_per_unit):
+                units.append((str(pdf_path), start, min(start + self.pages_per_unit, page_count)))
+                
+        # Largest ranges first so the tail of the queue is made of small units
+        units.sort(key=lambda unit: unit[2] - unit[1], reverse=True)
+        return units
+        
+    def ingest(self):
+        """Parse every PDF under the root on a shared process pool."""
+        start_time = time.perf_counter()
+        pdf_paths = self.find_pdfs()
+        units = self.plan_work_units(pdf_paths)
+        print(f"Found {len(pdf_paths)} PDFs, scheduled {len(units)} work units on {self.workers} workers")
+        
+        results = {}
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            futures = {
+                executor.submit(_process_work_unit, pdf_path, self.output_dir, start, end): (pdf_path, start)
+                for pdf_path, start, end in units
+            }
+            for future in as_completed(futures):
+                pdf_path, start = futures[future]
+                try:
+                    results[(pdf_path, start)] = future.result()
+                except Exception as e:
+                    print(f"Error processing {pdf_path} from page {start + 1}: {str(e)}")
+                    
+        # Resolve duplicate IDs in file and page order, not completion order
+        questions_by_id = {}
+        for pdf_path, start in sorted(results):
+            metadata = describe_pdf_path(pdf_path, self.root_dir)
+            source = str(Path(pdf_path).relative_to(self.root_dir))
+            for question in results[(pdf_path, start)]:
+                question.update(metadata)
+                question["source"] = source
+                questions_by_id.setdefault(question["id"], question)
+                
+        # Group the merged corpus by its metadata
+        merged = sorted(
+            questions_by_id.values(),
+            key=lambda q: (q["subject"], q["domain"], q["skill"], q["source"], q["id"])
+        )
+        
+        elapsed = time.perf_counter() - start_time
+        print(f"\nParsed {len(merged)} questions from {len(pdf_paths)} PDFs in {elapsed:.1f}s")
+        return {
+            "questions": merged
+        }
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Parse SAT question bank PDFs.")
+    arg_parser.add_argument("pdf_path", nargs="?", default="SAT Suite Question Bank - Results.pdf")
+    arg_parser.add_argument("--root", help="Ingest every PDF under this directory in parallel")
+    arg_parser.add_argument("--output-dir", default="data/questions")
+    arg_parser.add_argument("--workers", type=int, default=None)
+    arg_parser.add_argument("--pages-per-unit", type=int, default=8)
+    args = arg_parser.parse_args()
+    
+    if args.root:
+        ingestor = BatchIngestor(args.root, args.output_dir, args.workers, args.pages_per_unit)
+        try:
+            data = ingestor.ingest()
+        except ValueError as e:
+            print(f"❌ {e}")
+            raise SystemExit(1)
+        SATQuestionParser(None, args.output_dir).save_json(data)
+        return
+    
+    parser = SATQuestionParser(args.pdf_path, args.output_dir)
     data = parser.process_pdf()
     parser.save_json(data)
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
@@ -3,6 +3,8 @@ import os
 from pathlib import Path
 import re
 
+from question_model import Question, questions_to_dicts
+
 class QuestionProcessor:
     def __init__(self, digital_json_path, images_dir, output_dir):
         self.digital_json_path = digital_json_path
@@ -60,32 +62,26 @@ class QuestionProcessor:
         return text.strip()
         
     def process_question(self, question_data):
-        """Convert a question to our iOS-friendly format."""
+        """Convert a question to our compact in-memory format."""
         content = question_data.get('content', {})
         
         # Clean the content while preserving MathML
         stem = self.clean_math_text(content.get('stem', ''))
         rationale = self.clean_math_text(content.get('rationale', ''))
         
-        return {
-            "id": question_data.get('questionId'),
-            "type": content.get('type'),
-            "subject": question_data.get('module', '').capitalize(),
-            "topic": question_data.get('primary_class_cd_desc'),
-            "skill": question_data.get('skill_desc'),
-            "difficulty": question_data.get('difficulty'),
-            "question": {
-                "text": stem,
-                "original_math": stem,
-                "options": content.get('answerOptions', []),
-                "correct_answers": content.get('correct_answer', [])
-            },
-            "explanation": {
-                "text": rationale,
-                "original_math": rationale
-            },
-            "images": self.get_image_paths_for_question(question_data.get('questionId', ''))
-        }
+        return Question(
+            id=question_data.get('questionId'),
+            type=content.get('type'),
+            subject=question_data.get('module', '').capitalize(),
+            topic=question_data.get('primary_class_cd_desc'),
+            skill=question_data.get('skill_desc'),
+            difficulty=question_data.get('difficulty'),
+            text=stem,
+            options=content.get('answerOptions', []),
+            correct_answers=content.get('correct_answer', []),
+            explanation=rationale,
+            images=self.get_image_paths_for_question(question_data.get('questionId', ''))
+        )
         
     def process_all_questions(self):
         """Process all questions and create organized output."""
@@ -97,16 +93,16 @@ class QuestionProcessor:
         for _, question_data in digital_questions.items():
             processed = self.process_question(question_data)
             
-            subject = processed['subject']
-            topic = processed['topic']
-            
-            # Create nested structure
-            if subject not in organized_data:
-                organized_data[subject] = {}
-            if topic not in organized_data[subject]:
-                organized_data[subject][topic] = []
+            # Subject and topic are interned, so these lookups hash and
+            # compare shared string objects
+            topics = organized_data.get(processed.subject)
+            if topics is None:
+                topics = organized_data[processed.subject] = {}
+            questions = topics.get(processed.topic)
+            if questions is None:
+                questions = topics[processed.topic] = []
                 
-            organized_data[subject][topic].append(processed)
+            questions.append(processed)
             
         return organized_data
         
@@ -120,7 +116,10 @@ class QuestionProcessor:
             with open(output_path, 'w') as f:
                 json.dump({
                     "subject": subject,
-                    "topics": topics
+                    "topics": {
+                        topic: questions_to_dicts(questions)
+                        for topic, questions in topics.items()
+                    }
                 }, f, indent=2)
             print(f"Saved {output_path}")
             
@@ -138,6 +137,36 @@ class QuestionProcessor:
         with open(manifest_path, 'w') as f:
             json.dump(manifest, f, indent=2)
         print(f"Saved {manifest_path}")
+        
+    def load_output(self, strict=False):
+        """Load previously saved subject files back into compact questions.
+        
+        With strict, a subject listed in the manifest but missing on disk is
+        an error, since saving the result would drop it from the manifest.
+        """
+        data = {}
+        manifest_path = os.path.join(self.output_dir, "questions_manifest.json")
+        if not os.path.exists(manifest_path):
+            return data
+            
+        with open(manifest_path, 'r') as f:
+            manifest = json.load(f)
+            
+        for subject in manifest.get("subjects", []):
+            subject_path = os.path.join(self.output_dir, f"{subject.lower()}_questions.json")
+            if not os.path.exists(subject_path):
+                if strict:
+                    raise FileNotFoundError(f"Manifest lists {subject} but {subject_path} is missing")
+                print(f"⚠️ Missing {subject_path}, skipping {subject}")
+                continue
+            with open(subject_path, 'r') as f:
+                subject_data = json.load(f)
+            data[subject] = {
+                topic: [Question.from_dict(q) for q in questions]
+                for topic, questions in subject_data.get("topics", {}).items()
+            }
+            
+        return data
 
 def main():
     # Paths
@@ -0,0 +1,118 @@
+import sys
+from typing import Dict, List, Optional, Tuple, Union
+
+
+def intern_field(value):
+    """Intern a categorical string so every question shares one copy."""
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+class AnswerOption:
+    """A single answer choice as delivered by the question bank."""
+    __slots__ = ("id", "content")
+
+    def __init__(self, id: Optional[str], content: Optional[str]):
+        self.id = id
+        self.content = content
+
+    @classmethod
+    def from_raw(cls, option) -> Union["AnswerOption", str]:
+        """Wrap a raw option dict; plain string options are kept as-is."""
+        if isinstance(option, dict):
+            return cls(option.get('id'), option.get('content'))
+        return option
+
+    def to_dict(self) -> Dict:
+        return {"id": self.id, "content": self.content}
+
+    def __eq__(self, other):
+        if not isinstance(other, AnswerOption):
+            return NotImplemented
+        return self.id == other.id and self.content == other.content
+
+    def __repr__(self):
+        return f"AnswerOption(id={self.id!r})"
+
+
+class Question:
+    """Compact in-memory form of a processed question.
+
+    Categorical fields are interned, lists are stored as tuples and the
+    stem and rationale are held once; the duplicated ``original_math``
+    fields only appear when serializing with ``to_dict``.
+    """
+    __slots__ = (
+        "id", "type", "subject", "topic", "skill", "difficulty",
+        "text", "options", "correct_answers", "explanation", "images",
+    )
+
+    def __init__(self, id: Optional[str], type: Optional[str], subject: str,
+                 topic: Optional[str], skill: Optional[str],
+                 difficulty: Optional[str], text: str,
+                 options: Tuple = (), correct_answers: Tuple[str, ...] = (),
+                 explanation: str = "", images: Tuple[str, ...] = ()):
+        self.id = id
+        self.type = intern_field(type)
+        self.subject = intern_field(subject)
+        self.topic = intern_field(topic)
+        self.skill = intern_field(skill)
+        self.difficulty = intern_field(difficulty)
+        self.text = text
+        self.options = tuple(AnswerOption.from_raw(option) for option in options)
+        self.correct_answers = tuple(intern_field(answer) for answer in correct_answers)
+        self.explanation = explanation
+        self.images = tuple(images)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Question":
+        """Build a question from the processed JSON shape."""
+        question = data.get('question', {})
+        explanation = data.get('explanation', {})
+        return cls(
+            id=data.get('id'),
+            type=data.get('type'),
+            subject=data.get('subject', ''),
+            topic=data.get('topic'),
+            skill=data.get('skill'),
+            difficulty=data.get('difficulty'),
+            text=question.get('text') or question.get('original_math') or '',
+            options=question.get('options') or (),
+            correct_answers=question.get('correct_answers') or (),
+            explanation=explanation.get('text') or explanation.get('original_math') or '',
+            images=data.get('images') or (),
+        )
+
+    def to_dict(self) -> Dict:
+        """Serialize to the processed JSON shape consumed by the app."""
+        return {
+            "id": self.id,
+            "type": self.type,
+            "subject": self.subject,
+            "topic": self.topic,
+            "skill": self.skill,
+            "difficulty": self.difficulty,
+            "question": {
+                "text": self.text,
+                "original_math": self.text,
+                "options": [
+                    option.to_dict() if isinstance(option, AnswerOption) else option
+                    for option in self.options
+                ],
+                "correct_answers": list(self.correct_answers)
+            },
+            "explanation": {
+                "text": self.explanation,
+                "original_math": self.explanation
+            },
+            "images": list(self.images)
+        }
+
+    def __repr__(self):
+        return f"Question(id={self.id!r}, topic={self.topic!r}, difficulty={self.difficulty!r})"
+
+
+def questions_to_dicts(questions: List[Question]) -> List[Dict]:
+    """Serialize a list of questions at the output boundary."""
+    return [question.to_dict() for question in questions]
@@ -5,6 +5,8 @@ import time
 from dataclasses import dataclass
 import random
 
+from scraper_transport import TransportConfig, mount_transport
+
 @dataclass
 class SATQuestion:
     id: str
@@ -19,8 +21,11 @@ class SATQuestion:
 class SATQuestionScraper:
     BASE_URL = "https://satsuitequestionbank.collegeboard.org"
     
-    def __init__(self):
+    def __init__(self, transport_config: Optional[TransportConfig] = None, base_url: str = None):
+        self.base_url = base_url or self.BASE_URL
         self.session = requests.Session()
+        # Pooled keep-alive connections with timeouts and retry/backoff
+        self.transport = mount_transport(self.session, transport_config)
         # Set common headers that mimic a real browser
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36',
@@ -41,7 +46,7 @@ class SATQuestionScraper:
             print("Initializing session...")
             # Visit the main page first
             response = self.session.get(
-                f"{self.BASE_URL}/questionbank",
+                f"{self.base_url}/questionbank",
                 allow_redirects=True
             )
             response.raise_for_status()
@@ -53,7 +58,7 @@ class SATQuestionScraper:
             # Update headers for subsequent requests
             self.session.headers.update({
                 'Accept': 'application/json, text/plain, */*',
-                'Referer': f"{self.BASE_URL}/questionbank",
+                'Referer': f"{self.base_url}/questionbank",
                 'Sec-Fetch-Dest': 'empty',
                 'Sec-Fetch-Mode': 'cors',
                 'Sec-Fetch-Site': 'same-origin',
@@ -80,7 +85,7 @@ class SATQuestionScraper:
             # Add a random delay between requests (1-3 seconds)
             time.sleep(random.uniform(1, 3))
             
-            url = f"{self.BASE_URL}/api/questionbank/questions"
+            url = f"{self.base_url}/api/questionbank/questions"
             params = {
                 "page": page,
                 "limit": per_page,
@@ -129,7 +134,7 @@ class SATQuestionScraper:
     def get_question_details(self, question_id: str) -> Optional[Dict]:
         """Fetch detailed information for a specific question."""
         try:
-            response = self.session.get(f"{self.BASE_URL}/api/questionbank/questions/{question_id}")
+            response = self.session.get(f"{self.base_url}/api/questionbank/questions/{question_id}")
             response.raise_for_status()
             
             data = response.json()
@@ -143,6 +148,10 @@ class SATQuestionScraper:
                 print(f"Response content: {e.response.text}")
             return None
 
+    def pool_metrics(self) -> Dict[str, Dict]:
+        """Per-host request, retry and connection pool metrics."""
+        return self.transport.pool_metrics()
+
     def scrape_all_questions(self, max_pages: int = None) -> List[SATQuestion]:
         """Scrape all questions with pagination."""
         all_questions = []
@@ -0,0 +1,191 @@
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Dict, FrozenSet, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+@dataclass
+class TransportConfig:
+    pool_connections: int = 4  # distinct hosts kept in the pool manager
+    pool_maxsize: int = 8  # connections kept alive per host
+    pool_block: bool = False
+    keep_alive: bool = True
+    connect_timeout: float = 5.0
+    read_timeout: float = 30.0
+    max_retries: int = 5
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    respect_retry_after: bool = True
+    retry_after_max: float = 120.0  # longer Retry-After waits are not retried
+    retry_statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+    retry_methods: FrozenSet[str] = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+@dataclass
+class HostMetrics:
+    requests: int = 0
+    attempts: int = 0
+    retries: int = 0
+    failures: int = 0
+    timeouts: int = 0
+    connection_errors: int = 0
+    retry_statuses: Dict[int, int] = field(default_factory=dict)
+    backoff_seconds: float = 0.0
+    elapsed_seconds: float = 0.0
+
+
+class RetryingHTTPAdapter(HTTPAdapter):
+    """Connection-pooled adapter with timeouts and jittered exponential backoff."""
+
+    def __init__(self, config: Optional[TransportConfig] = None, sleep=time.sleep, rng=None):
+        self.transport_config = config or TransportConfig()
+        self._sleep = sleep
+        self._rng = rng or random.Random()
+        self._metrics: Dict[str, HostMetrics] = {}
+        self._metrics_lock = threading.Lock()
+        # Retries are handled in send() so backoff and metrics stay in one place
+        super().__init__(
+            pool_connections=self.transport_config.pool_connections,
+            pool_maxsize=self.transport_config.pool_maxsize,
+            max_retries=0,
+            pool_block=self.transport_config.pool_block,
+        )
+
+    def _host_metrics(self, url) -> HostMetrics:
+        host = urlsplit(url).netloc
+        with self._metrics_lock:
+            metrics = self._metrics.get(host)
+            if metrics is None:
+                metrics = self._metrics[host] = HostMetrics()
+            return metrics
+
+    def backoff_delay(self, attempt: int, response=None) -> Optional[float]:
+        """Full-jitter exponential backoff, replaced by a valid Retry-After.
+        
+        Returns None when the server asks for a longer wait than
+        retry_after_max, in which case the caller should not retry.
+        """
+        config = self.transport_config
+        if response is not None and config.respect_retry_after:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return retry_after if retry_after <= config.retry_after_max else None
+        ceiling = min(config.backoff_max, config.backoff_base * (2 ** attempt))
+        return self._rng.uniform(0, ceiling)
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        if timeout is None:
+            timeout = (self.transport_config.connect_timeout, self.transport_config.read_timeout)
+        if not self.transport_config.keep_alive:
+            request.headers["Connection"] = "close"
+
+        metrics = self._host_metrics(request.url)
+        retryable = request.method in self.transport_config.retry_methods
+        attempt = 0
+        start = time.perf_counter()
+        with self._metrics_lock:
+            metrics.requests += 1
+
+        try:
+            while True:
+                with self._metrics_lock:
+                    metrics.attempts += 1
+                try:
+                    response = super().send(request, stream=stream, timeout=timeout,
+                                            verify=verify, cert=cert, proxies=proxies)
+                    if not stream:
+                        # Session.send would read the body after we return, outside
+                        # the retry loop; read it here so mid-body stalls are retried
+                        response.content
+                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                        requests.exceptions.ChunkedEncodingError) as e:
+                    is_timeout = isinstance(e, requests.exceptions.Timeout) or "timed out" in str(e).lower()
+                    with self._metrics_lock:
+                        if is_timeout:
+                            metrics.timeouts += 1
+                        else:
+                            metrics.connection_errors += 1
+                    if not retryable or attempt >= self.transport_config.max_retries:
+                        with self._metrics_lock:
+                            metrics.failures += 1
+                        raise
+                    delay = self.backoff_delay(attempt)
+                else:
+                    delay = None
+                    if (response.status_code in self.transport_config.retry_statuses
+                            and retryable and attempt < self.transport_config.max_retries):
+                        delay = self.backoff_delay(attempt, response)
+                    if delay is None:
+                        if response.status_code >= 500 or response.status_code in self.transport_config.retry_statuses:
+                            with self._metrics_lock:
+                                metrics.failures += 1
+                        return response
+                    with self._metrics_lock:
+                        metrics.retry_statuses[response.status_code] = (
+                            metrics.retry_statuses.get(response.status_code, 0) + 1
+                        )
+                    # Release the connection back to the pool before waiting
+                    response.close()
+
+                attempt += 1
+                with self._metrics_lock:
+                    metrics.retries += 1
+                    metrics.backoff_seconds += delay
+                self._sleep(delay)
+        finally:
+            with self._metrics_lock:
+                metrics.elapsed_seconds += time.perf_counter() - start
+
+    def pool_metrics(self) -> Dict[str, Dict]:
+        """Per-host request counters merged with live connection pool state."""
+        with self._metrics_lock:
+            report = {host: dict(vars(metrics), retry_statuses=dict(metrics.retry_statuses))
+                      for host, metrics in self._metrics.items()}
+
+        pools = self.poolmanager.pools
+        for key in pools.keys():
+            try:
+                pool = pools[key]
+            except KeyError:
+                continue  # evicted since keys() was taken
+            host = pool.host if pool.port in (None, 80, 443) else f"{pool.host}:{pool.port}"
+            entry = report.setdefault(host, {})
+            # The pool queue is pre-filled with None placeholders for unopened slots
+            idle = [conn for conn in pool.pool.queue if conn is not None] if pool.pool is not None else []
+            entry.update({
+                "pool_maxsize": pool.pool.maxsize if pool.pool is not None else 0,
+                "pool_idle": len(idle),
+                "connections_opened": pool.num_connections,
+                "pool_requests": pool.num_requests,
+            })
+        return report
+
+
+def parse_retry_after(value) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def mount_transport(session: requests.Session, config: Optional[TransportConfig] = None) -> RetryingHTTPAdapter:
+    """Mount one retrying adapter for both schemes on a session."""
+    adapter = RetryingHTTPAdapter(config)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return adapter
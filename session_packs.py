@@ -0,0 +1,187 @@
+import argparse
+import json
+import os
+import random
+from collections import deque
+from typing import Dict, List, Optional
+
+from process_questions import QuestionProcessor
+from question_model import Question
+
+PACK_FILENAME = "session_packs.json"
+PACK_VERSION = 1
+
+DIFFICULTIES = ("E", "M", "H")
+
+# Same fallback order DataService uses when a difficulty runs short
+ADJACENT_DIFFICULTIES = {
+    "E": ("M",),
+    "M": ("E", "H"),
+    "H": ("M",),
+}
+
+
+class SessionPackBuilder:
+    def __init__(self, session_length: int = 10, min_topics: int = 2,
+                 max_sessions: Optional[int] = None, seed: int = 0):
+        self.session_length = session_length
+        self.min_topics = min_topics
+        self.max_sessions = max_sessions
+        self.seed = seed
+
+    def build_index(self, data: Dict[str, Dict[str, List[Question]]]) -> Dict:
+        """Group question IDs by subject, topic and difficulty."""
+        index = {}
+        for subject, topics in data.items():
+            subject_index = index.setdefault(subject, {})
+            for topic, questions in topics.items():
+                topic_index = subject_index.setdefault(topic, {})
+                for question in questions:
+                    topic_index.setdefault(question.difficulty, []).append(question.id)
+        return index
+
+    def _topic_queues(self, subject_index: Dict, difficulty: str, rng: random.Random) -> Dict[str, deque]:
+        queues = {}
+        for topic in sorted(subject_index):
+            ids = list(subject_index[topic].get(difficulty, []))
+            if ids:
+                rng.shuffle(ids)
+                queues[topic] = deque(ids)
+        return queues
+
+    def _draw(self, queues: Dict[str, deque], count: int, used: set, session: List[str]):
+        """Take up to count IDs, cycling through topics with the most left first."""
+        while count > 0:
+            topics = sorted(
+                (topic for topic, queue in queues.items() if queue),
+                key=lambda topic: -len(queues[topic])
+            )
+            if not topics:
+                return
+            for topic in topics:
+                if count == 0:
+                    return
+                question_id = queues[topic].popleft()
+                if question_id in used:
+                    continue
+                used.add(question_id)
+                session.append(question_id)
+                count -= 1
+
+    def build_sessions(self, subject_index: Dict, difficulty: str, rng: random.Random) -> List[List[str]]:
+        """Partition a difficulty into topic-balanced sessions."""
+        primary = self._topic_queues(subject_index, difficulty, rng)
+        available = sum(len(queue) for queue in primary.values())
+        if not available:
+            return []
+
+        session_count = -(-available // self.session_length)
+        if self.max_sessions is not None:
+            session_count = min(session_count, self.max_sessions)
+
+        # Stride every shuffled topic queue across the sessions, so each
+        # session gets a share of every topic proportional to its size
+        # instead of the largest topic's surplus piling up at the end
+        ordered = [question_id for queue in primary.values() for question_id in queue]
+        sessions = []
+        for offset in range(session_count):
+            session = ordered[offset::session_count][:self.session_length]
+            used = set(session)
+
+            # Top up short sessions from adjacent difficulties without
+            # consuming them, so every session keeps its full length
+            for fallback in ADJACENT_DIFFICULTIES[difficulty]:
+                missing = self.session_length - len(session)
+                if missing <= 0:
+                    break
+                share = missing if fallback == ADJACENT_DIFFICULTIES[difficulty][-1] else -(-missing // 2)
+                self._draw(self._topic_queues(subject_index, fallback, rng), share, used, session)
+
+            rng.shuffle(session)
+            sessions.append(session)
+
+        return sessions
+
+    def topic_coverage_ok(self, session: List[str], topic_of: Dict[str, str], topic_count: int) -> bool:
+        needed = min(self.min_topics, topic_count, len(session))
+        return len({topic_of[question_id] for question_id in session}) >= needed
+
+    def build(self, data: Dict[str, Dict[str, List[Question]]]) -> Dict:
+        """Build the full pack for a processed corpus."""
+        rng = random.Random(self.seed)
+        index = self.build_index(data)
+        sessions = {}
+
+        for subject, subject_index in index.items():
+            topic_of = {
+                question_id: topic
+                for topic, by_difficulty in subject_index.items()
+                for ids in by_difficulty.values()
+                for question_id in ids
+            }
+            subject_sessions = sessions.setdefault(subject, {})
+            for difficulty in DIFFICULTIES:
+                built = self.build_sessions(subject_index, difficulty, rng)
+                kept = [
+                    session for session in built
+                    if self.topic_coverage_ok(session, topic_of, len(subject_index))
+                ]
+                if len(kept) < len(built):
+                    print(f"⚠️ Dropped {len(built) - len(kept)} {subject} {difficulty} sessions "
+                          f"covering fewer than {self.min_topics} topics")
+                subject_sessions[difficulty] = kept
+
+        return {
+            "version": PACK_VERSION,
+            "session_length": self.session_length,
+            "min_topics": self.min_topics,
+            "index": index,
+            "sessions": sessions,
+        }
+
+    def save(self, pack: Dict, output_dir: str) -> str:
+        output_path = os.path.join(output_dir, PACK_FILENAME)
+        with open(output_path, 'w') as f:
+            json.dump(pack, f, separators=(",", ":"))
+        total = sum(len(s) for by_difficulty in pack["sessions"].values() for s in by_difficulty.values())
+        print(f"Saved {total} sessions to {output_path} ({os.path.getsize(output_path)} bytes)")
+        return output_path
+
+
+def load_pack(output_dir: str) -> Dict:
+    with open(os.path.join(output_dir, PACK_FILENAME), 'r') as f:
+        return json.load(f)
+
+
+def pick_session(pack: Dict, subject: str, difficulty: str, rng: Optional[random.Random] = None) -> List[str]:
+    """Return the question IDs of a ready-made session in constant time."""
+    sessions = pack["sessions"].get(subject, {}).get(difficulty, [])
+    if not sessions:
+        return []
+    return sessions[(rng or random).randrange(len(sessions))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute quiz session packs from the processed corpus.")
+    parser.add_argument("--output-dir", default="data/processed_questions")
+    parser.add_argument("--session-length", type=int, default=10)
+    parser.add_argument("--min-topics", type=int, default=2)
+    parser.add_argument("--max-sessions", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    processor = QuestionProcessor(None, "data/questions/images", args.output_dir)
+    data = processor.load_output()
+
+    builder = SessionPackBuilder(
+        session_length=args.session_length,
+        min_topics=args.min_topics,
+        max_sessions=args.max_sessions,
+        seed=args.seed,
+    )
+    pack = builder.build(data)
+    builder.save(pack, args.output_dir)
+
+
+if __name__ == "__main__":
+    main()
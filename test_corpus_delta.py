@@ -0,0 +1,70 @@
+import json
+import os
+import shutil
+
+import pytest
+
+from corpus_delta import apply_delta, create_delta, scan_version
+
+
+def question(question_id, difficulty="M"):
+    return {
+        "id": question_id,
+        "type": "mcq",
+        "subject": "English",
+        "topic": "Craft and Structure",
+        "skill": "Words in Context",
+        "difficulty": difficulty,
+        "question": {"text": "<p>Q</p>", "original_math": "<p>Q</p>", "options": [], "correct_answers": ["A"]},
+        "explanation": {"text": "E", "original_math": "E"},
+        "images": [f"{question_id}_img_1.png"],
+    }
+
+
+def write_corpus(root, questions, images):
+    os.makedirs(os.path.join(root, "images"), exist_ok=True)
+    with open(os.path.join(root, "english_questions.json"), "w") as f:
+        json.dump({"subject": "English", "topics": {"Craft and Structure": questions}}, f, indent=2)
+    with open(os.path.join(root, "questions_manifest.json"), "w") as f:
+        json.dump({"subjects": ["English"], "total_questions": len(questions)}, f, indent=2)
+    for name, data in images.items():
+        with open(os.path.join(root, "images", name), "wb") as f:
+            f.write(data)
+
+
+@pytest.fixture
+def versions(tmp_path):
+    old_root = str(tmp_path / "v1")
+    new_root = str(tmp_path / "v2")
+    write_corpus(old_root, [question("a"), question("b"), question("c")],
+                 {"a_img_1.png": b"A", "b_img_1.png": b"B", "c_img_1.png": b"C"})
+    write_corpus(new_root, [question("a", "H"), question("c"), question("d")],
+                 {"a_img_1.png": b"A", "c_img_1.png": b"C", "d_img_1.png": b"D"})
+    package = str(tmp_path / "delta.zip")
+    create_delta(old_root, new_root, package)
+    return old_root, new_root, package
+
+
+def test_apply_to_new_directory(versions, tmp_path):
+    old_root, new_root, package = versions
+    output_root = str(tmp_path / "v3")
+    apply_delta(old_root, package, output_root)
+    assert scan_version(output_root) == scan_version(new_root)
+
+
+@pytest.mark.parametrize("suffix", ["", "/"])
+def test_apply_in_place(versions, tmp_path, suffix):
+    old_root, new_root, package = versions
+    target = str(tmp_path / "in_place")
+    shutil.copytree(old_root, target)
+    apply_delta(target + suffix, package, target + suffix)
+    assert scan_version(target) == scan_version(new_root)
+    # No staging or backup directories are left next to the output
+    assert sorted(os.listdir(tmp_path)) == ["delta.zip", "in_place", "v1", "v2"]
+
+
+def test_rejects_wrong_base(versions, tmp_path):
+    _, new_root, package = versions
+    with pytest.raises(ValueError):
+        apply_delta(new_root, package, str(tmp_path / "v3"))
+    assert not os.path.exists(tmp_path / "v3")
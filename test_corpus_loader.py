@@ -0,0 +1,29 @@
+import json
+
+from corpus_loader import CorpusLoader
+from question_model import Question, questions_to_dicts
+
+
+def write_corpus(output_dir):
+    """Manifest lists Math, but only the English file exists."""
+    questions = [
+        Question(id=f"eng-{n}", type="mcq", subject="English", topic="Craft and Structure",
+                 skill="Words in Context", difficulty="M", text=f"<p>Question {n}</p>")
+        for n in range(3)
+    ]
+    with open(output_dir / "questions_manifest.json", 'w') as f:
+        json.dump({"subjects": ["Math", "English"]}, f, indent=2)
+    with open(output_dir / "english_questions.json", 'w') as f:
+        json.dump({"subject": "English", "topics": {"Craft and Structure": questions_to_dicts(questions)}},
+                  f, indent=2)
+
+
+def test_find_skips_subjects_missing_on_disk(tmp_path):
+    write_corpus(tmp_path)
+    loader = CorpusLoader(str(tmp_path), str(tmp_path / "images"))
+
+    question = loader.find("eng-2")
+    assert question is not None
+    assert question.id == "eng-2"
+    assert question.topic == "Craft and Structure"
+    assert loader.find("missing") is None
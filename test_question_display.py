@@ -1,6 +1,6 @@
-import json
 import os
-from PIL import Image  # For verifying images
+
+from corpus_loader import CorpusLoader, image_size
 
 def display_question(question_data):
     """Display a question in a readable format."""
@@ -33,8 +33,12 @@ def display_question(question_data):
         for image_path in question_data['images']:
             full_path = os.path.join("data/questions/images", image_path)
             if os.path.exists(full_path):
-                img = Image.open(full_path)
-                print(f"- {image_path} ({img.size[0]}x{img.size[1]} pixels)")
+                # Only the file header is read, pixels are never decoded
+                size = image_size(full_path)
+                if size:
+                    print(f"- {image_path} ({size[0]}x{size[1]} pixels)")
+                else:
+                    print(f"- {image_path} (unknown format)")
             else:
                 print(f"- {image_path} (not found)")
     
@@ -47,14 +51,11 @@ def display_question(question_data):
 def test_math_display():
     """Test loading and displaying math questions."""
     try:
-        # Load the processed math questions
-        with open("data/processed_questions/math_questions.json", "r") as f:
-            math_data = json.load(f)
-        
-        # Get the first topic's first question
-        first_topic = next(iter(math_data['topics'].values()))
-        if first_topic:
-            first_question = first_topic[0]
+        # Only the first math question is decoded, not the whole subject file
+        loader = CorpusLoader()
+        first_topic = loader.topics("Math")[0]
+        if loader.question_count("Math", first_topic):
+            first_question = loader.get("Math", first_topic, 0).to_dict()
             
             # Display the question
             display_question(first_question)
@@ -0,0 +1,216 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+
+from sat_scraper import SATQuestionScraper
+from scraper_transport import TransportConfig, parse_retry_after
+
+
+class FaultInjectingHandler(BaseHTTPRequestHandler):
+    """Local stub that fails the first few requests to each URL on purpose.
+
+    Query parameters pick the fault: ``fault=503|429|stall|slowbody|drop`` and
+    ``times=N`` for how many requests to break before answering normally.
+    """
+    protocol_version = "HTTP/1.1"
+    counts = {}
+    lock = threading.Lock()
+
+    def do_GET(self):
+        query = parse_qs(urlsplit(self.path).query)
+        fault = query.get("fault", [""])[0]
+        times = int(query.get("times", ["0"])[0])
+        with self.lock:
+            seen = self.counts.get(self.path, 0)
+            self.counts[self.path] = seen + 1
+
+        if seen < times:
+            if fault in ("503", "429"):
+                self._send(int(fault), {"error": "injected"}, {"Retry-After": query.get("retry_after", ["0"])[0]})
+                return
+            if fault == "stall":
+                time.sleep(float(query.get("stall", ["1"])[0]))
+            elif fault == "slowbody":
+                self._send(200, {"items": []}, stall=float(query.get("stall", ["1"])[0]))
+                return
+            elif fault == "drop":
+                self.close_connection = True
+                self.connection.shutdown(2)
+                return
+
+        self._send(200, {"items": [{"id": "q1", "difficulty": "easy", "domain": "Algebra", "skill": "Linear"}]})
+
+    do_POST = do_GET
+
+    def _send(self, status, payload, headers=None, stall=0):
+        body = json.dumps(payload).encode("utf-8")
+        try:
+            self.send_response(status)
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if stall:
+                # Headers and half the body arrive, then the socket goes quiet
+                self.wfile.write(body[:len(body) // 2])
+                self.wfile.flush()
+                time.sleep(stall)
+                self.close_connection = True
+                return
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FaultInjectingHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def make_scraper(server, **overrides):
+    settings = dict(connect_timeout=1.0, read_timeout=0.5, backoff_base=0.01, backoff_max=0.05)
+    settings.update(overrides)
+    config = TransportConfig(**settings)
+    return SATQuestionScraper(config, base_url=f"http://127.0.0.1:{server.server_port}")
+
+
+def test_retries_server_errors():
+    server = start_stub_server()
+    try:
+        scraper = make_scraper(server)
+        response = scraper.session.get(f"{scraper.base_url}/api?fault=503&times=3")
+        assert response.status_code == 200
+        host = f"127.0.0.1:{server.server_port}"
+        metrics = scraper.pool_metrics()[host]
+        assert metrics["retries"] == 3
+        assert metrics["retry_statuses"] == {503: 3}
+        # All attempts reused a single keep-alive connection
+        assert metrics["connections_opened"] == 1
+    finally:
+        server.shutdown()
+
+
+def test_gives_up_after_max_retries():
+    server = start_stub_server()
+    try:
+        scraper = make_scraper(server, max_retries=2)
+        response = scraper.session.get(f"{scraper.base_url}/api?fault=503&times=10")
+        assert response.status_code == 503
+        metrics = scraper.pool_metrics()[f"127.0.0.1:{server.server_port}"]
+        assert metrics["attempts"] == 3
+        assert metrics["failures"] == 1
+    finally:
+        server.shutdown()
+
+
+def test_respects_retry_after():
+    server = start_stub_server()
+    try:
+        # Retry-After wins over the much shorter backoff_max
+        scraper = make_scraper(server)
+        start = time.perf_counter()
+        response = scraper.session.get(f"{scraper.base_url}/api?fault=429&times=1&retry_after=1")
+        assert response.status_code == 200
+        assert time.perf_counter() - start >= 1.0
+    finally:
+        server.shutdown()
+
+
+def test_does_not_retry_past_retry_after_max():
+    server = start_stub_server()
+    try:
+        scraper = make_scraper(server, retry_after_max=5.0)
+        start = time.perf_counter()
+        response = scraper.session.get(f"{scraper.base_url}/api?fault=503&times=1&retry_after=120")
+        assert response.status_code == 503
+        assert time.perf_counter() - start < 5.0
+        metrics = scraper.pool_metrics()[f"127.0.0.1:{server.server_port}"]
+        assert metrics["attempts"] == 1
+    finally:
+        server.shutdown()
+
+
+def test_retries_stall_mid_body():
+    server = start_stub_server()
+    try:
+        scraper = make_scraper(server)
+        response = scraper.session.get(f"{scraper.base_url}/api?fault=slowbody&times=1&stall=2")
+        assert response.status_code == 200
+        assert response.json()["items"]
+        metrics = scraper.pool_metrics()[f"127.0.0.1:{server.server_port}"]
+        assert metrics["timeouts"] == 1
+        assert metrics["retries"] == 1
+    finally:
+        server.shutdown()
+
+
+def test_recovers_from_stalls_and_drops():
+    server = start_stub_server()
+    try:
+        scraper = make_scraper(server)
+        stalled = scraper.session.get(f"{scraper.base_url}/api?fault=stall&times=1&stall=2")
+        dropped = scraper.session.get(f"{scraper.base_url}/api?fault=drop&times=2")
+        assert stalled.status_code == 200 and dropped.status_code == 200
+        metrics = scraper.pool_metrics()[f"127.0.0.1:{server.server_port}"]
+        assert metrics["timeouts"] == 1
+        assert metrics["connection_errors"] == 2
+    finally:
+        server.shutdown()
+
+
+def test_non_idempotent_requests_are_not_retried():
+    server = start_stub_server()
+    try:
+        scraper = make_scraper(server)
+        try:
+            scraper.session.post(f"{scraper.base_url}/api?fault=drop&times=1")
+        except requests.exceptions.ConnectionError:
+            pass
+        metrics = scraper.pool_metrics()[f"127.0.0.1:{server.server_port}"]
+        assert metrics["attempts"] == 1
+    finally:
+        server.shutdown()
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def main():
+    print("🔍 Testing scraper transport against a fault-injecting stub server...\n")
+    tests = [
+        test_retries_server_errors,
+        test_gives_up_after_max_retries,
+        test_respects_retry_after,
+        test_does_not_retry_past_retry_after_max,
+        test_retries_stall_mid_body,
+        test_recovers_from_stalls_and_drops,
+        test_non_idempotent_requests_are_not_retried,
+        test_parse_retry_after,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e}")
+    print(f"\n📊 {len(tests) - failed}/{len(tests)} transport tests passed")
+
+
+if __name__ == "__main__":
+    main()
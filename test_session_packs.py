@@ -0,0 +1,37 @@
+from question_model import Question
+from session_packs import DIFFICULTIES, SessionPackBuilder
+
+
+def make_corpus():
+    """One dominant topic, the shape that used to strand questions in late sessions."""
+    sizes = {"Information and Ideas": 120, "Craft and Structure": 40,
+             "Expression of Ideas": 25, "Standard English Conventions": 15}
+    topics = {}
+    for topic, size in sizes.items():
+        topics[topic] = [
+            Question(id=f"{topic[:3]}-{difficulty}-{n}", type="mcq", subject="English", topic=topic,
+                     skill="Skill", difficulty=difficulty, text="")
+            for difficulty in DIFFICULTIES
+            for n in range(size)
+        ]
+    return {"English": topics}
+
+
+def test_every_indexed_id_is_in_some_session():
+    pack = SessionPackBuilder(session_length=10, min_topics=2).build(make_corpus())
+    for subject, subject_index in pack["index"].items():
+        for difficulty in DIFFICULTIES:
+            indexed = {qid for by_difficulty in subject_index.values() for qid in by_difficulty.get(difficulty, [])}
+            sessions = pack["sessions"][subject][difficulty]
+            assert indexed <= {qid for session in sessions for qid in session}
+
+
+def test_sessions_are_full_and_cover_topics():
+    corpus = make_corpus()
+    pack = SessionPackBuilder(session_length=10, min_topics=3).build(corpus)
+    topic_of = {q.id: topic for topic, questions in corpus["English"].items() for q in questions}
+    for sessions in pack["sessions"]["English"].values():
+        assert sessions
+        for session in sessions:
+            assert len(session) == len(set(session)) == 10
+            assert len({topic_of[qid] for qid in session}) >= 3